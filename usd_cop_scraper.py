@@ -1,100 +1,264 @@
 from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+import requests
+import lxml.html
+import numpy as np
 import pandas as pd
+import argparse
 import json
 import time
 import os
-from datetime import datetime, timedelta
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
 
-def scrape_with_selenium():
+URL = "https://30rates.com/usd-cop"
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+# Scraped dates are day/month without the year, e.g. "25/07"
+DATE_PATTERN = r'^(\d{1,2})/(\d{1,2})$'
+
+# Spellings of Friday as they appear in the table, matched without lowercasing every row
+FRIDAY_NAMES = frozenset({'Friday', 'friday', 'FRIDAY'})
+
+# A Friday's values are repeated for the weekend, indexed by day offset from Friday
+WEEKEND_DAYS = np.array(['Friday', 'Saturday', 'Sunday'])
+
+# Written next to the output files so the next run can send a conditional request
+CACHE_META_FILENAME = "forecast_usd.meta.json"
+CACHED_OUTPUT_FILES = ("forecast_usd.xlsx", "forecast_usd.csv")
+
+# Returned instead of rows when the server answers 304 Not Modified
+NOT_MODIFIED = object()
+
+# Calls back as soon as table.tbh exists in the DOM
+WAIT_FOR_TABLE_JS = (
+    "const cb = arguments[arguments.length - 1];"
+    "const q = () => document.querySelector('table.tbh');"
+    "if (q()) return cb(true);"
+    "new MutationObserver((_, o) => { if (q()) { o.disconnect(); cb(true); } })"
+    ".observe(document, {childList: true, subtree: true});"
+)
+
+# Buffer size for the CSV/JSON output handles, so each file is flushed in few large writes
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+# Returns the inner text of every <td>, grouped by <tr>, for the table passed as arguments[0]
+EXTRACT_TABLE_JS = (
+    "return Array.from(arguments[0].querySelectorAll('tr'))"
+    ".map(r => Array.from(r.querySelectorAll('td')).map(c => c.innerText));"
+)
+
+def load_cache_meta(output_path="."):
+    """
+    Load the HTTP validators (ETag / Last-Modified) saved by the previous run.
+    Returns an empty dict if there is no cache or its output files are gone
+    """
+    meta_filename = os.path.join(output_path, CACHE_META_FILENAME)
+    cached_files = [meta_filename] + [os.path.join(output_path, f) for f in CACHED_OUTPUT_FILES]
+    
+    if not all(os.path.exists(f) for f in cached_files):
+        return {}
+    
+    try:
+        with open(meta_filename, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Warning: Could not read cache metadata {meta_filename}: {e}")
+        return {}
+
+def save_cache_meta(validators, output_path="."):
     """
-    Uses Selenium to scrape USD-COP data from 30rates.com
-    This method simulates a real browser and is harder to block
+    Persist the HTTP validators of the page we just scraped for the next run.
+    Without validators any previous metadata is removed, since it no longer
+    describes the files that were just written
+    """
+    meta_filename = os.path.join(output_path, CACHE_META_FILENAME)
+    
+    if not any(validators.values()):
+        try:
+            if os.path.exists(meta_filename):
+                os.remove(meta_filename)
+        except OSError as e:
+            print(f"Warning: Could not remove stale cache metadata {meta_filename}: {e}")
+        return
+    
+    meta = dict(validators, saved_at=datetime.now().isoformat(timespec='seconds'))
+    
+    try:
+        with open(meta_filename, 'w', encoding='utf-8') as f:
+            json.dump(meta, f, indent=2)
+    except OSError as e:
+        print(f"Warning: Could not save cache metadata {meta_filename}: {e}")
+
+def _cells_to_rows(rows):
+    """
+    Turns the cell texts of each table row into raw row dicts,
+    skipping rows with fewer than 5 cells or only empty cells
+    """
+    data = []
+    
+    for i, cells in enumerate(rows):
+        if len(cells) >= 5:
+            row_data = {
+                'Date': cells[0].strip(),
+                'Weekday': cells[1].strip(),
+                'Min': cells[2].strip(),
+                'Max': cells[3].strip(),
+                'Rate': cells[4].strip()
+            }
+            
+            # Skip empty rows
+            if any(row_data.values()):
+                data.append(row_data)
+                if i < 5:  # Show first 5 rows
+                    print(f"Row {len(data)}: {row_data}")
+    
+    return data
+
+def scrape_with_requests(cache_meta=None):
+    """
+    Fetches the USD-COP page with a plain HTTP request and parses the table with lxml.
+    The forecast table is server-rendered, so no browser is needed.
+    cache_meta holds the validators of the previous run, sent as a conditional GET.
+    Returns (rows, validators): rows is NOT_MODIFIED if the server answered 304
+    and None if the request fails or the table is not found
+    """
+    cache_meta = cache_meta or {}
+    headers = {"User-Agent": USER_AGENT}
+    if cache_meta.get("etag"):
+        headers["If-None-Match"] = cache_meta["etag"]
+    if cache_meta.get("last_modified"):
+        headers["If-Modified-Since"] = cache_meta["last_modified"]
+    
+    try:
+        print(f"Fetching {URL}...")
+        resp = requests.get(URL, headers=headers, timeout=15)
+        
+        if resp.status_code == 304:
+            return NOT_MODIFIED, cache_meta
+        
+        if resp.status_code != 200:
+            print(f"Unexpected HTTP status: {resp.status_code}")
+            return None, {}
+        
+        # Validators of this exact response, saved once its rows are written
+        validators = {
+            "etag": resp.headers.get("ETag"),
+            "last_modified": resp.headers.get("Last-Modified")
+        }
+        
+        tree = lxml.html.fromstring(resp.content)
+        rows = tree.xpath("//table[contains(@class,'tbh')]//tr")
+        
+        if not rows:
+            print("Could not find the forecast table in the HTML")
+            return None, {}
+        
+        # Extract table data
+        print("Extracting table data...")
+        data = _cells_to_rows([cell.text_content() for cell in row.xpath(".//td")] for row in rows)
+        
+        if not data:
+            print("Forecast table has no data rows")
+            return None, {}
+        
+        print(f"Successfully extracted {len(data)} rows")
+        return data, validators
+        
+    except Exception as e:
+        print(f"Error during HTTP scraping: {e}")
+        return None, {}
+
+def scrape_data(service_url=None, cache_meta=None):
+    """
+    Scrapes and formats USD-COP data, trying a direct HTTP fetch first
+    and falling back to Selenium if that fails.
+    service_url is passed through to scrape_with_selenium(), cache_meta to scrape_with_requests().
+    Returns (data, validators); data is NOT_MODIFIED if the page did not change
+    """
+    data, validators = scrape_with_requests(cache_meta)
+    
+    if data is NOT_MODIFIED:
+        return NOT_MODIFIED, validators
+    
+    if data is None:
+        print("HTTP scraping failed, falling back to Selenium...")
+        data = scrape_with_selenium(service_url)
+    
+    if not data:
+        return None, {}
+    
+    # Process and format the data
+    return process_and_format_data(data), validators
+
+def scrape_with_selenium(service_url=None):
+    """
+    Uses Selenium to scrape raw USD-COP rows from 30rates.com
+    This method simulates a real browser and is harder to block;
+    it is used as a fallback when the plain HTTP fetch fails.
+    If service_url is given, connects to an already running chromedriver
+    (e.g. "http://127.0.0.1:9515") instead of spawning a new one
     """
     
     # Setup Chrome options for GitHub Actions
     chrome_options = Options()
-    chrome_options.add_argument("--headless")  # Required for GitHub Actions
+    chrome_options.add_argument("--headless=new")  # Required for GitHub Actions
     chrome_options.add_argument("--no-sandbox")  # Required for GitHub Actions
     chrome_options.add_argument("--disable-dev-shm-usage")  # Required for GitHub Actions
     chrome_options.add_argument("--disable-gpu")
     chrome_options.add_argument("--window-size=1920,1080")
-    chrome_options.add_argument("--disable-extensions")
-    chrome_options.add_argument("--disable-web-security")
-    chrome_options.add_argument("--allow-running-insecure-content")
-    chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+    chrome_options.add_argument("--blink-settings=imagesEnabled=false")  # Only the table is needed
+    chrome_options.add_argument(f"--user-agent={USER_AGENT}")
+    chrome_options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+    chrome_options.page_load_strategy = 'eager'  # Return from driver.get() at DOMContentLoaded
+    
+    # Drive the Chrome installed by setup-chrome, not whatever Chrome is on the runner
+    chrome_bin = os.environ.get("CHROME_BIN")
+    if chrome_bin:
+        chrome_options.binary_location = chrome_bin
     
     driver = None
     
     try:
-        print("Starting Chrome browser...")
-        driver = webdriver.Chrome(options=chrome_options)
+        if service_url:
+            print(f"Connecting to chromedriver at {service_url}...")
+            driver = webdriver.Remote(command_executor=service_url, options=chrome_options)
+        else:
+            print("Starting Chrome browser...")
+            driver = webdriver.Chrome(options=chrome_options)
         
         print("Navigating to 30rates.com...")
-        driver.get("https://30rates.com/usd-cop")
+        driver.get(URL)
         
-        # Wait for page to load
+        # Wait for the table to appear, resolved by a MutationObserver instead of polling
         print("Waiting for page to load...")
-        WebDriverWait(driver, 15).until(
-            EC.presence_of_element_located((By.TAG_NAME, "table"))
-        )
+        driver.implicitly_wait(0)
+        driver.set_script_timeout(15)
+        try:
+            driver.execute_async_script(WAIT_FOR_TABLE_JS)
+        except TimeoutException:
+            print("Timed out waiting for the forecast table")
+            return None
         
         # Find the table
         print("Looking for forecast table...")
-        tables = driver.find_elements(By.TAG_NAME, "table")
-        
-        target_table = None
-        
-        # Look for the table with class "tbh" or containing forecast data
-        for table in tables:
-            try:
-                table_class = table.get_attribute("class")
-                table_text = table.text
-                
-                if "tbh" in (table_class or "") or ("Date" in table_text and "Weekday" in table_text):
-                    target_table = table
-                    print("Found target table!")
-                    break
-            except:
-                continue
-        
-        if not target_table:
+        try:
+            target_table = driver.find_element(By.CSS_SELECTOR, "table.tbh")
+            print("Found target table!")
+        except NoSuchElementException:
             print("Could not find the forecast table")
             return None
         
-        # Extract table data
+        # Extract all cell texts in a single WebDriver call
         print("Extracting table data...")
-        data = []
-        
-        rows = target_table.find_elements(By.TAG_NAME, "tr")
-        
-        for i, row in enumerate(rows):
-            cells = row.find_elements(By.TAG_NAME, "td")
-            
-            if len(cells) >= 5:
-                row_data = {
-                    'Date': cells[0].text.strip(),
-                    'Weekday': cells[1].text.strip(),
-                    'Min': cells[2].text.strip(),
-                    'Max': cells[3].text.strip(),
-                    'Rate': cells[4].text.strip()
-                }
-                
-                # Skip empty rows
-                if any(row_data.values()):
-                    data.append(row_data)
-                    if i < 5:  # Show first 5 rows
-                        print(f"Row {len(data)}: {row_data}")
+        data = _cells_to_rows(driver.execute_script(EXTRACT_TABLE_JS, target_table))
         
         print(f"Successfully extracted {len(data)} rows")
-        
-        # Process and format the data
-        formatted_data = process_and_format_data(data)
-        return formatted_data
+        return data
         
     except Exception as e:
         print(f"Error during scraping: {e}")
@@ -105,6 +269,13 @@ def scrape_with_selenium():
             driver.quit()
             print("Browser closed")
 
+def valid_rows_mask(dates, numbers):
+    """
+    Boolean mask of the rows that parsed into a real date and numeric Min/Max/Rate.
+    Invalid values are expected as NaT/NaN from coerced parsing
+    """
+    return dates.notna() & numbers.notna().all(axis=1)
+
 def process_and_format_data(raw_data):
     """
     Process raw data to add proper date formatting, convert to numbers,
@@ -112,70 +283,102 @@ def process_and_format_data(raw_data):
     """
     print("Processing and formatting data...")
     
-    formatted_data = []
+    if not raw_data:
+        return []
+    
     current_year = datetime.now().year
+    numeric_columns = ['Min', 'Max', 'Rate']
     
-    # Process each row from scraped data
-    for i, row in enumerate(raw_data):
-        try:
-            # Parse the date (format: "25/07" -> "25/07/2025")
-            date_parts = row['Date'].split('/')
-            if len(date_parts) == 2:
-                day = int(date_parts[0])
-                month = int(date_parts[1])
-                
-                # Create full date
-                full_date = datetime(current_year, month, day)
-                formatted_date = full_date.strftime("%d/%m/%Y")
-                
-                # Convert numeric values
-                min_val = float(row['Min'].replace(',', ''))
-                max_val = float(row['Max'].replace(',', ''))
-                rate_val = float(row['Rate'].replace(',', ''))
-                
-                # Add the main row (weekday)
-                formatted_row = {
-                    'Date': formatted_date,
-                    'Weekday': row['Weekday'],
-                    'Min': min_val,
-                    'Max': max_val,
-                    'Rate': rate_val
-                }
-                formatted_data.append(formatted_row)
-                
-                # Check if it's Friday - if so, add Saturday and Sunday with same values
-                if row['Weekday'].lower() == 'friday':
-                    # Add Saturday
-                    saturday_date = (full_date + timedelta(days=1)).strftime("%d/%m/%Y")
-                    saturday_row = {
-                        'Date': saturday_date,
-                        'Weekday': 'Saturday',
-                        'Min': min_val,
-                        'Max': max_val,
-                        'Rate': rate_val
-                    }
-                    formatted_data.append(saturday_row)
-                    
-                    # Add Sunday
-                    sunday_date = (full_date + timedelta(days=2)).strftime("%d/%m/%Y")
-                    sunday_row = {
-                        'Date': sunday_date,
-                        'Weekday': 'Sunday',
-                        'Min': min_val,
-                        'Max': max_val,
-                        'Rate': rate_val
-                    }
-                    formatted_data.append(sunday_row)
-                    
-                    print(f"Added weekend data for {formatted_date} (Friday)")
-                
-        except Exception as e:
-            print(f"Error processing row {i}: {row} - {e}")
-            continue
+    try:
+        df = pd.DataFrame(raw_data, columns=['Date', 'Weekday'] + numeric_columns)
+        
+        # Parse the date (format: "25/07" -> "25/07/2025"), malformed dates become NaT
+        date_parts = df['Date'].str.extract(DATE_PATTERN).astype(float)
+        dates = pd.to_datetime(
+            {'year': current_year, 'month': date_parts[1], 'day': date_parts[0]},
+            errors='coerce'
+        )
+        
+        # Convert numeric values, anything unparseable becomes NaN
+        numbers = df[numeric_columns].apply(
+            lambda s: pd.to_numeric(s.str.replace(',', '', regex=False), errors='coerce')
+        ).astype(float)
+        
+        # Drop invalid rows in one pass, logging them once with their raw values
+        valid = valid_rows_mask(dates, numbers)
+        if not valid.all():
+            print(f"Skipping {(~valid).sum()} invalid rows:")
+            print(df[~valid].to_string(index=False))
+        
+        df = df[valid].assign(Date=dates[valid])
+        df[numeric_columns] = numbers[valid]
+        
+        # Fridays are repeated 3 times and shifted 0/1/2 days into Friday, Saturday and Sunday
+        is_friday = df['Weekday'].isin(FRIDAY_NAMES)
+        weekend = df[is_friday].loc[lambda d: d.index.repeat(len(WEEKEND_DAYS))]
+        offsets = np.tile(np.arange(len(WEEKEND_DAYS)), is_friday.sum())
+        weekend = weekend.assign(
+            Date=weekend['Date'] + pd.to_timedelta(offsets, unit='D'),
+            Weekday=WEEKEND_DAYS[offsets]
+        )
+        print(f"Added weekend data for {is_friday.sum()} Fridays")
+        
+        # Weekend rows share their Friday's index, so a stable sort keeps them in place
+        df = pd.concat([df[~is_friday], weekend]).sort_index(kind='stable')
+        df['Date'] = df['Date'].dt.strftime("%d/%m/%Y")
+        
+        formatted_data = df.to_dict('records')
+        
+    except Exception as e:
+        # Bad rows are filtered above, this only catches unexpected failures
+        print(f"Error processing data: {e}")
+        return []
     
     print(f"Processed {len(raw_data)} original rows into {len(formatted_data)} total rows")
     return formatted_data
 
+def _write_xlsx(df, excel_filename):
+    """Write the formatted Excel file"""
+    with pd.ExcelWriter(excel_filename, engine='xlsxwriter') as writer:
+        df.to_excel(writer, sheet_name='USD_COP_Forecast', index=False)
+        
+        # Get the workbook and worksheet for formatting
+        workbook = writer.book
+        worksheet = writer.sheets['USD_COP_Forecast']
+        
+        # Add basic formatting
+        header_format = workbook.add_format({
+            'bold': True, 'font_color': 'white', 'bg_color': '#4472C4',
+            'align': 'center', 'valign': 'vcenter'
+        })
+        center_format = workbook.add_format({'align': 'center', 'valign': 'vcenter'})
+        number_format = workbook.add_format({
+            'num_format': '#,##0.000', 'align': 'center', 'valign': 'vcenter'
+        })
+        
+        # Rewrite the header cells, pandas already gave them its own format
+        for col_num, column_name in enumerate(df.columns):
+            worksheet.write(0, col_num, column_name, header_format)
+        
+        # Column widths and formats apply to every data cell without per-cell styling
+        worksheet.set_column('A:B', 12, center_format)  # Date, Weekday
+        worksheet.set_column('C:E', 10, number_format)  # Min, Max, Rate
+
+def _write_csv(df, csv_filename):
+    """Write the CSV copy for compatibility"""
+    with open(csv_filename, 'w', buffering=WRITE_BUFFER_SIZE, newline='', encoding='utf-8') as f:
+        df.to_csv(f, index=False)
+
+def _write_json(df, json_filename):
+    """
+    Write the timestamped JSON backup.
+    pandas escapes the forward slashes in the dates and writes no space
+    after ":", so the text differs from json.dump but parses to the same values.
+    The default 10-digit precision writes the few-decimal rates exactly
+    """
+    with open(json_filename, 'w', buffering=WRITE_BUFFER_SIZE, encoding='utf-8') as f:
+        df.to_json(f, orient='records', indent=2, force_ascii=False)
+
 def save_data(data, output_path="."):
     """Save extracted data to Excel file - GitHub Actions version"""
     if not data:
@@ -202,94 +405,65 @@ def save_data(data, output_path="."):
     csv_filename = os.path.join(output_path, "forecast_usd.csv")
     json_filename = os.path.join(output_path, f"forecast_usd_{timestamp}.json")
     
-    try:
-        # Save Excel file
-        with pd.ExcelWriter(excel_filename, engine='openpyxl') as writer:
-            new_df.to_excel(writer, sheet_name='USD_COP_Forecast', index=False)
-            
-            # Get the workbook and worksheet for formatting
-            workbook = writer.book
-            worksheet = writer.sheets['USD_COP_Forecast']
-            
-            # Add basic formatting
-            try:
-                from openpyxl.styles import Font, PatternFill, Alignment
-                
-                # Header formatting
-                header_font = Font(bold=True, color='FFFFFF')
-                header_fill = PatternFill(start_color='4472C4', end_color='4472C4', fill_type='solid')
-                center_alignment = Alignment(horizontal='center', vertical='center')
-                
-                # Apply header formatting
-                for cell in worksheet[1]:
-                    cell.font = header_font
-                    cell.fill = header_fill
-                    cell.alignment = center_alignment
-                
-                # Format data cells
-                for row in worksheet.iter_rows(min_row=2, max_row=worksheet.max_row):
-                    for cell in row:
-                        cell.alignment = center_alignment
-                        
-                        # Format numeric columns with thousands separator
-                        if cell.column in [3, 4, 5]:  # Min, Max, Rate columns
-                            if isinstance(cell.value, (int, float)):
-                                cell.number_format = '#,##0.000'
-                
-                # Auto-adjust column widths
-                column_widths = {
-                    'A': 12,  # Date
-                    'B': 12,  # Weekday  
-                    'C': 10,  # Min
-                    'D': 10,  # Max
-                    'E': 10   # Rate
-                }
-                
-                for col_letter, width in column_widths.items():
-                    worksheet.column_dimensions[col_letter].width = width
-                    
-            except ImportError as e:
-                print(f"Warning: Could not apply advanced formatting: {e}")
-        
-        print(f"✅ Excel file saved: {excel_filename}")
-        
-        # Also save as CSV for compatibility
-        new_df.to_csv(csv_filename, index=False)
-        print(f"✅ CSV file saved: {csv_filename}")
-        
-        # Save JSON backup
-        with open(json_filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-        print(f"✅ JSON backup saved: {json_filename}")
-        
-        print(f"📊 Total rows in files: {len(new_df)}")
-        
-        # Show data summary
-        weekday_counts = new_df['Weekday'].value_counts()
-        print(f"📈 Data breakdown: {dict(weekday_counts)}")
+    writers = {
+        "Excel file": (_write_xlsx, new_df, excel_filename),
+        "CSV file": (_write_csv, new_df, csv_filename),
+        "JSON backup": (_write_json, new_df, json_filename),
+    }
+    
+    # The three files are independent, so write them concurrently
+    failed = False
+    with ThreadPoolExecutor(max_workers=len(writers)) as executor:
+        futures = {
+            executor.submit(writer, payload, filename): (label, filename)
+            for label, (writer, payload, filename) in writers.items()
+        }
         
-    except Exception as e:
-        print(f"❌ Error saving files: {e}")
+        for future in as_completed(futures):
+            label, filename = futures[future]
+            try:
+                future.result()
+                print(f"✅ {label} saved: {filename}")
+            except Exception as e:
+                print(f"❌ Error saving {label}: {e}")
+                failed = True
+    
+    if failed:
         # Fallback to just CSV
         try:
             new_df.to_csv("forecast_usd_fallback.csv", index=False)
             print(f"📁 Saved fallback CSV file")
         except Exception as e2:
             print(f"❌ Even CSV fallback failed: {e2}")
+    else:
+        print(f"📊 Total rows in files: {len(new_df)}")
+        
+        # Show data summary
+        weekday_counts = new_df.groupby('Weekday', sort=False).size()
+        print(f"📈 Data breakdown: {dict(weekday_counts)}")
     
-    # Display data preview
-    print(f"\n📊 Data Preview ({len(new_df)} total rows):")
-    print("=" * 60)
-    print(new_df.head(10).to_string(index=False))
-    
-    if len(new_df) > 10:
-        print(f"... and {len(new_df) - 10} more rows")
+    # Display data preview only on a terminal or when asked for (PREVIEW=1)
+    if sys.stdout.isatty() or os.environ.get("PREVIEW", "0") == "1":
+        print(f"\n📊 Data Preview ({len(new_df)} total rows):")
+        print("=" * 60)
+        print(new_df.head(10).to_string(index=False))
+        
+        if len(new_df) > 10:
+            print(f"... and {len(new_df) - 10} more rows")
     
     print(f"\n✅ GitHub Actions process completed!")
     print(f"📈 {len(data)} new records processed")
-    return excel_filename
+    return None if failed else excel_filename
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="USD-COP forecast scraper")
+    parser.add_argument(
+        "--service-url",
+        default=os.environ.get("CHROMEDRIVER_URL"),
+        help="URL of a running chromedriver to reuse for the Selenium fallback (e.g. http://127.0.0.1:9515)"
+    )
+    args = parser.parse_args()
+    
     print("USD-COP Scraper for GitHub Actions")
     print("=" * 50)
     print("🤖 Running in GitHub Actions environment")
@@ -298,16 +472,22 @@ if __name__ == "__main__":
     
     # Check if required packages are installed
     try:
-        import openpyxl
-        print("✅ openpyxl found - Excel formatting will be applied")
+        import xlsxwriter
+        print("✅ xlsxwriter found - Excel formatting will be applied")
     except ImportError:
-        print("⚠️  openpyxl not found - basic Excel file will be created")
+        print("⚠️  xlsxwriter not found - only CSV fallback will be created")
     
     print("\n🚀 Starting scraping process...")
-    data = scrape_with_selenium()
+    data, validators = scrape_data(service_url=args.service_url, cache_meta=load_cache_meta())
+    
+    if data is NOT_MODIFIED:
+        print("✅ No change upstream - keeping existing forecast_usd.xlsx and forecast_usd.csv")
+        exit(0)
     
     if data:
         excel_file = save_data(data)
+        if excel_file:
+            save_cache_meta(validators)
         print(f"\n🎉 Success! {len(data)} rows extracted and saved!")
         print("📁 Files created:")
         print(f"   • Excel: forecast_usd.xlsx")
@@ -319,5 +499,5 @@ if __name__ == "__main__":
         print("\n🔧 Possible issues:")
         print("1. Website structure changed")
         print("2. Network connectivity issues")
-        print("3. Chrome/Selenium compatibility")
+        print("3. Chrome/Selenium compatibility (fallback scraper)")
         exit(1)  # Exit with error code for GitHub Actions